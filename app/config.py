@@ -15,4 +15,8 @@ TOKEN_EXPIRY_DAYS = int(os.getenv("TOKEN_EXPIRY_DAYS", "30"))
 TMP_DIR = os.getenv("TMP_DIR", "tmp")
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "output")
 IMAGE_RETENTION_HOURS = int(os.getenv("IMAGE_RETENTION_HOURS", "24"))
-BASE_URL = os.getenv("BASE_URL", "http://localhost:8000") 
\ No newline at end of file
+BASE_URL = os.getenv("BASE_URL", "http://localhost:8000") 
+
+# Model runtime settings
+# Threads per ONNX Runtime session (0 keeps the onnxruntime default)
+ORT_INTRA_OP_THREADS = int(os.getenv("ORT_INTRA_OP_THREADS", "0"))
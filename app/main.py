@@ -3,7 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.routes import health, token, faceswap
 import os
 from app.config import TMP_DIR, OUTPUT_DIR
-from app.utils.cleanup import setup_image_cleanup_scheduler
+from app.utils.cleanup import CleanupSchedulerElection
 import uvicorn
 
 app = FastAPI(title="Face Swap API")
@@ -26,12 +26,16 @@ app.include_router(health.router)
 app.include_router(token.router)
 app.include_router(faceswap.router)
 
-# Setup cleanup scheduler
-scheduler = setup_image_cleanup_scheduler()
+# Setup cleanup scheduler (one worker process runs it when there are several)
+cleanup_scheduler = CleanupSchedulerElection()
+
+@app.on_event("startup")
+def startup_event():
+    cleanup_scheduler.start()
 
 @app.on_event("shutdown")
 def shutdown_event():
-    scheduler.shutdown()
+    cleanup_scheduler.stop()
 
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
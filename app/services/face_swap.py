@@ -3,8 +3,10 @@ import cv2
 import numpy as np
 import datetime
 import insightface
+import onnxruntime
 from insightface.app import FaceAnalysis
 import urllib.request
+from app.config import ORT_INTRA_OP_THREADS
 
 # Ensure directories exist
 os.makedirs("tmp", exist_ok=True)
@@ -24,12 +26,35 @@ if not os.path.exists(model_path):
     urllib.request.urlretrieve(url, model_path)
     print("Model download complete!")
 
+providers = ['CPUExecutionProvider']
+
+def limit_session_threads(models):
+    """
+    Rebuilds each model's ONNX Runtime session with a fixed number of threads.
+    
+    A session with a single thread does not start a thread pool, so it keeps
+    working in worker processes forked from a preloading gunicorn master,
+    which share the loaded weights copy-on-write.
+    
+    Args:
+        models (list): InsightFace models exposing `model_file` and `session`
+    """
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = ORT_INTRA_OP_THREADS
+    options.inter_op_num_threads = ORT_INTRA_OP_THREADS
+    for model in models:
+        model.session = onnxruntime.InferenceSession(model.model_file, sess_options=options, providers=providers)
+
 # Initialize face detector
-app = FaceAnalysis(name='buffalo_l', providers=['CPUExecutionProvider'])
+app = FaceAnalysis(name='buffalo_l', providers=providers)
 app.prepare(ctx_id=-1, det_size=(640, 640))
 
 # Load swapper
-swapper = insightface.model_zoo.get_model(model_path, providers=['CPUExecutionProvider'])
+swapper = insightface.model_zoo.get_model(model_path, providers=providers)
+
+# Pin session threads when configured (gunicorn.conf.py sets this for forked workers)
+if ORT_INTRA_OP_THREADS > 0:
+    limit_session_threads(list(app.models.values()) + [swapper])
 
 class FaceSwapService:
     @staticmethod
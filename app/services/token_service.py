@@ -4,8 +4,8 @@ from pymongo import MongoClient
 from bson import ObjectId
 from app.config import MONGO_URI, DB_NAME
 
-# MongoDB connection
-client = MongoClient(MONGO_URI)
+# MongoDB connection (connect lazily so a preloading master never forks an open client)
+client = MongoClient(MONGO_URI, connect=False)
 db = client[DB_NAME]
 tokens_collection = db["tokens"]
 usage_collection = db["usage"]
@@ -1,10 +1,26 @@
+import hashlib
+import os
+import tempfile
+import threading
 from apscheduler.schedulers.background import BackgroundScheduler
+from app.config import OUTPUT_DIR
 from app.services.image_service import ImageService
 
+try:
+    import fcntl
+except ImportError:  # Windows has no flock
+    fcntl = None
+
+# One lock per output directory, so processes serving the same files run a single scheduler
+CLEANUP_LOCK_FILE = os.path.join(
+    tempfile.gettempdir(),
+    f"faceswap-cleanup-{hashlib.sha1(os.path.abspath(OUTPUT_DIR).encode()).hexdigest()[:12]}.lock"
+)
+
 def setup_image_cleanup_scheduler():
     """
     Schedules periodic cleanup of expired images.
-    
+
     Returns:
         BackgroundScheduler: The configured scheduler instance
     """
@@ -16,4 +32,71 @@ def setup_image_cleanup_scheduler():
         id='cleanup_images'
     )
     scheduler.start()
-    return scheduler 
\ No newline at end of file
+    return scheduler
+
+class CleanupSchedulerElection:
+    """
+    Runs the image cleanup scheduler in exactly one of several worker processes.
+
+    Every worker calls start(). The worker that takes an exclusive lock on
+    CLEANUP_LOCK_FILE runs the scheduler. The others wait for the lock in a
+    background thread. The kernel releases the lock when its holder exits or is
+    killed, so a waiting worker then takes over.
+    """
+    def __init__(self, lock_path=CLEANUP_LOCK_FILE):
+        self.lock_path = lock_path
+        self.lock_file = None
+        self.scheduler = None
+        self.stopped = False
+        self.mutex = threading.Lock()
+
+    def start(self):
+        """
+        Runs the scheduler if this process wins the lock, otherwise waits for it.
+        """
+        if fcntl is None:
+            # Without flock only single-process deployments are supported
+            self.take_over()
+            return
+
+        self.lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            threading.Thread(target=self.wait_for_lock, name="cleanup-election", daemon=True).start()
+            return
+        self.take_over()
+
+    def wait_for_lock(self):
+        """
+        Blocks until the current holder releases the lock, then takes over.
+        """
+        try:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+        except (OSError, ValueError):
+            # The lock file was closed by stop()
+            return
+        self.take_over()
+
+    def take_over(self):
+        """
+        Starts the scheduler in this process unless it is shutting down.
+        """
+        with self.mutex:
+            if self.stopped:
+                return
+            self.scheduler = setup_image_cleanup_scheduler()
+            print(f"Image cleanup scheduler running in process {os.getpid()}")
+
+    def stop(self):
+        """
+        Stops the scheduler (if running here) and hands the lock to another worker.
+        """
+        with self.mutex:
+            self.stopped = True
+            if self.scheduler:
+                self.scheduler.shutdown()
+                self.scheduler = None
+        if self.lock_file:
+            self.lock_file.close()
+            self.lock_file = None
@@ -0,0 +1,63 @@
+import gc
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+# Gunicorn settings for running the API with several worker processes.
+#
+# The master imports the app (and the InsightFace models) once before forking,
+# so workers share the model weights copy-on-write instead of each loading its
+# own copy. Start with: gunicorn app.main:app
+
+# Read .env before the settings below, like app/config.py does
+load_dotenv()
+
+# Keep the collector off in the master while the app loads, so it doesn't leave
+# freed holes in pages the workers will share (re-enabled in post_fork)
+gc.disable()
+
+# Sessions are built in the master, and only single-threaded ones survive the fork.
+# The workers provide the parallelism.
+os.environ["ORT_INTRA_OP_THREADS"] = "1"
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# A swap blocks its worker for a few seconds, so allow for slow requests
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+# Time given to workers to finish in-flight swaps on shutdown or reload
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "60"))
+
+def when_ready(server):
+    """
+    Runs in the master once the app is preloaded, before workers are forked.
+
+    Args:
+        server (Arbiter): The gunicorn master process
+    """
+    server.log.info("Models preloaded, starting %s workers", server.num_workers)
+
+def pre_fork(server, worker):
+    """
+    Runs in the master just before each worker is forked.
+
+    Args:
+        server (Arbiter): The gunicorn master process
+        worker (Worker): The worker about to be forked
+    """
+    # Move the master's Python objects out of the collector's reach, so
+    # collections in the workers don't write to (and copy) their pages.
+    # The ONNX weights are native buffers the collector never touches.
+    gc.freeze()
+
+def post_fork(server, worker):
+    """
+    Runs in each worker just after it is forked.
+
+    Args:
+        server (Arbiter): The gunicorn master process
+        worker (Worker): The forked worker
+    """
+    gc.enable()